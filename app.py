@@ -1,23 +1,50 @@
 import dash
-from dash import dcc, html, Input, Output, callback
+from dash import dcc, html, Input, Output, State
 import pandas as pd
 import plotly.graph_objects as go
+import plotly.io as pio
 import base64
-import urllib.request
+import hashlib
+import io
+import tempfile
+from concurrent.futures import ThreadPoolExecutor
+import urllib3
 import os  # For environment variables (e.g., PORT for Render)
 import logging  # For logging debug/info messages
 from flask import Flask  # For explicit server control
-import gunicorn  # For production server hint (used by Render)
+from PIL import Image
+
+# Dash serializes its layout through plotly.io.json; pin the orjson engine (plotly's 'auto'
+# would pick it anyway) so startup fails fast if orjson is missing
+pio.json.config.default_engine = 'orjson'
 
 # Configure logging
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
-# Load data
-df = pd.read_csv(r'D:\App_dash\main_data_updated.csv')
-years = sorted(df['year'].unique())
+# Explicit column types so pandas skips inference; areas stay float64 to keep full precision
+DTYPES = {
+    'year': 'int16',
+    'Map Images Left': 'object',
+    'Extreme_Drought': 'float64',
+    'Extremely_Wet': 'float64',
+    'Moderate_Drought': 'float64',
+    'Moderately_Wet': 'float64',
+    'Near_Normal': 'float64',
+    'Severe_Drought': 'float64'
+}
+
+# Load data - use relative path for deployment
+df = pd.read_csv('main_data_updated.csv', dtype=DTYPES, engine='c')
+# One row per year; an accidentally repeated year keeps its first row
+yearly = df.drop_duplicates('year').set_index('year').sort_index()
+years = yearly.index.tolist()
+# One plain dict of values per year for O(1) lookups in callbacks
+ROWS = yearly.to_dict('index')
 
-app = dash.Dash(__name__, server=Flask(__name__))  # Use Flask server explicitly
+# Create Flask server (exposed as `server` for gunicorn)
+server = Flask(__name__)
+app = dash.Dash(__name__, server=server)
 
 # Define colors for categories
 colors = {
@@ -29,18 +56,63 @@ colors = {
     'Extreme_Drought': '#8B0000'
 }
 
-def get_image_base64(url):
+# Shared connection pool so image fetches reuse TCP/TLS connections to the host;
+# bounded timeouts make a stalled fetch fall back to the placeholder instead of hanging startup
+_POOL = urllib3.PoolManager(
+    maxsize=32,
+    timeout=urllib3.Timeout(connect=5, read=15),
+    retries=urllib3.Retry(2)
+)
+
+def compress_image(img_data):
+    # Shrink to twice the 280px display height and re-encode as JPEG;
+    # transparent areas are flattened onto white rather than black
+    img = Image.open(io.BytesIO(img_data)).convert('RGBA')
+    img = Image.alpha_composite(Image.new('RGBA', img.size, 'white'), img).convert('RGB')
+    img.thumbnail((560, 560))
+    buffer = io.BytesIO()
+    img.save(buffer, 'JPEG', quality=80, optimize=True)
+    return buffer.getvalue()
+
+# Save each map under assets/ so the browser fetches and caches it like any static file
+def save_map_image(year, url):
+    # The URL hash in the name invalidates both the on-disk and the browser cache
+    # whenever a year's source image moves
+    url_hash = hashlib.sha1(url.encode()).hexdigest()[:8]
+    filename = f'map_{year}_{url_hash}.jpg'
+    path = os.path.join(app.config.assets_folder, filename)
+    if os.path.exists(path):
+        return app.get_asset_url(filename)
     try:
-        with urllib.request.urlopen(url) as response:
-            img_data = response.read()
-        return f"data:image/jpeg;base64,{base64.b64encode(img_data).decode()}"
+        response = _POOL.request('GET', url)
+        if response.status != 200:
+            raise urllib3.exceptions.HTTPError(f"HTTP {response.status}")
+        img_data = compress_image(response.data)
+        # Write to a temp file and rename it into place so concurrent workers
+        # never serve a partially written image
+        fd, tmp_path = tempfile.mkstemp(dir=app.config.assets_folder, suffix='.tmp')
+        try:
+            with os.fdopen(fd, 'wb') as f:
+                f.write(img_data)
+            os.replace(tmp_path, path)
+        except BaseException:
+            os.remove(tmp_path)
+            raise
+        return app.get_asset_url(filename)
     except Exception as e:
         logger.error(f"Failed to load image from {url}: {e}")
         return "data:image/png;base64,iVBORw0KGgoAAAANSUhEUgAAAAEAAAABCAYAAAAfFcSJAAAADUlEQVR42mNkYPhfDwAChwGA60e6kgAAAABJRU5ErkJggg=="
 
+# Fetch every year's map once at startup so callbacks never touch the network
+# (each fetch is blocking I/O, so download them all concurrently)
+os.makedirs(app.config.assets_folder, exist_ok=True)
+map_urls = [ROWS[year]['Map Images Left'] for year in years]
+with ThreadPoolExecutor(max_workers=min(32, len(map_urls))) as executor:
+    YEAR_TO_MAP_SRC = dict(zip(years, executor.map(save_map_image, years, map_urls)))
+
 def create_pie_chart(year_data, year):
     categories = ['Extreme_Drought', 'Severe_Drought', 'Moderate_Drought', 'Extremely_Wet', 'Moderately_Wet', 'Near_Normal']
-    values = [year_data[cat].iloc[0] for cat in categories]
+    values = [year_data[cat] for cat in categories]
     chart_colors = [colors[cat] for cat in categories]
     
     fig = go.Figure(data=[go.Pie(
@@ -60,7 +132,30 @@ def create_pie_chart(year_data, year):
     )
     return fig
 
-def create_metric_card(category, value, side):
+# Pie charts depend only on the year, so build them once and treat them as read-only
+YEAR_TO_PIE = {year: create_pie_chart(ROWS[year], year) for year in years}
+
+# Optionally ship pies as pre-rendered PNGs instead of plotly.js figures; set STATIC_PIES=1
+# and `pip install kaleido` (left out of requirements.txt since it bundles Chromium)
+STATIC_PIES = os.environ.get('STATIC_PIES', '0') == '1'
+PIE_PROPERTY = 'src' if STATIC_PIES else 'figure'
+
+def render_pie_png(fig):
+    png_data = fig.to_image(format='png', width=300, height=250)
+    return f"data:image/png;base64,{base64.b64encode(png_data).decode()}"
+
+if STATIC_PIES:
+    YEAR_TO_PIE = {year: render_pie_png(fig) for year, fig in YEAR_TO_PIE.items()}
+else:
+    # Convert each figure to a plain dict once so serving the layout skips walking the Figure object
+    YEAR_TO_PIE = {year: fig.to_plotly_json() for year, fig in YEAR_TO_PIE.items()}
+
+def create_pie_component(pie_id):
+    if STATIC_PIES:
+        return html.Img(id=pie_id, style={'width': '100%', 'height': '250px', 'object-fit': 'contain'})
+    return dcc.Graph(id=pie_id, style={'height': '250px'})
+
+def create_metric_card(category, value):
     icons = {
         'Extreme_Drought': '☀️',
         'Extremely_Wet': '💧',
@@ -85,7 +180,36 @@ def create_metric_card(category, value, side):
         'flex': '1'
     })
 
+def build_metric_grid(year):
+    # Metric grid (3x2 layout)
+    categories_grid = [
+        ['Extreme_Drought', 'Severe_Drought', 'Moderate_Drought'],
+        ['Extremely_Wet', 'Moderately_Wet', 'Near_Normal']
+    ]
+    
+    return html.Div([
+        html.Div([
+            create_metric_card(cat, ROWS[year][cat]) for cat in row
+        ], style={'display': 'flex', 'justify-content': 'space-between'}) for row in categories_grid
+    ])
+
+# Metric cards are a pure function of the year, so build each grid once
+YEAR_TO_METRICS = {year: build_metric_grid(year) for year in years}
+
+# Everything the dashboard shows for a year, shipped to the browser once with the layout
+YEAR_DATA = {
+    str(year): {
+        'map': YEAR_TO_MAP_SRC[year],
+        'pie': YEAR_TO_PIE[year],
+        'metrics': YEAR_TO_METRICS[year]
+    }
+    for year in years
+}
+
 app.layout = html.Div([
+    # Precomputed per-year outputs read by the client-side callback
+    dcc.Store(id='year-data', data=YEAR_DATA),
+    
     # Header with title and dropdowns
     html.Div([
         html.H1("Marathwada Drought Dashboard Comparison", 
@@ -124,7 +248,7 @@ app.layout = html.Div([
             
             # Left pie chart
             html.Div([
-                dcc.Graph(id='pie-left', style={'height': '250px'})
+                create_pie_component('pie-left')
             ], style={'background': '#ffffff', 'border-radius': '8px', 'box-shadow': '0 2px 8px rgba(0,0,0,0.1)', 'margin-bottom': '10px'}),
             
             # Left metrics
@@ -141,7 +265,7 @@ app.layout = html.Div([
             
             # Right pie chart
             html.Div([
-                dcc.Graph(id='pie-right', style={'height': '250px'})
+                create_pie_component('pie-right')
             ], style={'background': '#ffffff', 'border-radius': '8px', 'box-shadow': '0 2px 8px rgba(0,0,0,0.1)', 'margin-bottom': '10px'}),
             
             # Right metrics
@@ -150,52 +274,27 @@ app.layout = html.Div([
     ], style={'display': 'flex', 'justify-content': 'space-between', 'padding': '15px', 'gap': '15px'})
 ], style={'font-family': 'Segoe UI, Arial, sans-serif', 'background': 'linear-gradient(135deg, #f5f7fa 0%, #c3cfe2 100%)', 'min-height': '100vh', 'margin': '0'})
 
-@callback(
-    [Output('map-left', 'src'),
-     Output('map-right', 'src'),
-     Output('pie-left', 'figure'),
-     Output('pie-right', 'figure'),
-     Output('metrics-left', 'children'),
-     Output('metrics-right', 'children')],
-    [Input('year-left', 'value'),
-     Input('year-right', 'value')]
-)
-def update_dashboard(year_left, year_right):
-    if not year_left or not year_right:
-        raise dash.exceptions.PreventUpdate
-    
-    # Get data for selected years
-    left_data = df[df['year'] == year_left]
-    right_data = df[df['year'] == year_right]
-    
-    # Get map images
-    map_left_src = get_image_base64(left_data['Map Images Left'].iloc[0])
-    map_right_src = get_image_base64(right_data['Map Images Left'].iloc[0])
-    
-    # Create pie charts
-    pie_left = create_pie_chart(left_data, year_left)
-    pie_right = create_pie_chart(right_data, year_right)
-    
-    # Create metric grids (3x2 layout)
-    categories_grid = [
-        ['Extreme_Drought', 'Severe_Drought', 'Moderate_Drought'],
-        ['Extremely_Wet', 'Moderately_Wet', 'Near_Normal']
-    ]
-    
-    metrics_left = html.Div([
-        html.Div([
-            create_metric_card(cat, left_data[cat].iloc[0], 'Left') for cat in row
-        ], style={'display': 'flex', 'justify-content': 'space-between'}) for row in categories_grid
-    ])
-    
-    metrics_right = html.Div([
-        html.Div([
-            create_metric_card(cat, right_data[cat].iloc[0], 'Right') for cat in row
-        ], style={'display': 'flex', 'justify-content': 'space-between'}) for row in categories_grid
-    ])
-    
-    return map_left_src, map_right_src, pie_left, pie_right, metrics_left, metrics_right
+# Swapping years only indexes into the precomputed store, so do it in the browser;
+# each side has its own callback so changing one dropdown leaves the other side alone
+for side in ['left', 'right']:
+    app.clientside_callback(
+        """
+        function(year, yearData) {
+            if (!year) {
+                throw window.dash_clientside.PreventUpdate;
+            }
+            const selected = yearData[year];
+            return [selected.map, selected.pie, selected.metrics];
+        }
+        """,
+        [Output(f'map-{side}', 'src'),
+         Output(f'pie-{side}', PIE_PROPERTY),
+         Output(f'metrics-{side}', 'children')],
+        Input(f'year-{side}', 'value'),
+        State('year-data', 'data')
+    )
 
 if __name__ == '__main__':
-    logger.info("Starting Dash application locally on port 8081")
-    app.run(host="127.0.0.1", port=8081, debug=True)  # Local development
\ No newline at end of file
+    port = int(os.environ.get('PORT', 8081))
+    logger.info(f"Starting Dash application locally on port {port}")
+    app.run(host="127.0.0.1", port=port, debug=True)  # Local development
\ No newline at end of file